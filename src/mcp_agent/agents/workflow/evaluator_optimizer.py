@@ -25,6 +25,87 @@ from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 logger = get_logger(__name__)
 
 
+# Static segments of the evaluation and refinement prompts. The builders splice the
+# dynamic values (iteration, request, response, feedback) between these.
+
+_EVAL_PROMPT_INTRO = (
+    "\nYou are an expert evaluator for content quality. Your task is to evaluate a "
+    "response against the user's original request.\n\n"
+    "Evaluate the response for iteration "
+)
+
+_EVAL_PROMPT_REQUEST = (
+    " and provide structured feedback on its quality and areas for improvement.\n\n"
+    "<fastagent:data>\n<fastagent:request>\n"
+)
+
+_EVAL_PROMPT_RESPONSE = "\n</fastagent:request>\n\n<fastagent:response>\n"
+
+_EVAL_PROMPT_OUTRO = """
+</fastagent:response>
+</fastagent:data>
+
+<fastagent:instruction>
+Your response MUST be valid JSON matching this exact format (no other text, markdown, or explanation):
+
+{
+  "rating": "RATING",
+  "feedback": "DETAILED FEEDBACK",
+  "needs_improvement": BOOLEAN,
+  "focus_areas": ["FOCUS_AREA_1", "FOCUS_AREA_2", "FOCUS_AREA_3"]
+}
+
+Where:
+- RATING: Must be one of: "EXCELLENT", "GOOD", "FAIR", or "POOR"
+  - EXCELLENT: No improvements needed
+  - GOOD: Only minor improvements possible
+  - FAIR: Several improvements needed
+  - POOR: Major improvements needed
+- DETAILED FEEDBACK: Specific, actionable feedback (as a single string)
+- BOOLEAN: true or false (lowercase, no quotes) indicating if further improvement is needed
+- FOCUS_AREAS: Array of 1-3 specific areas to focus on (empty array if no improvement needed)
+
+Example of valid response (DO NOT include the triple backticks in your response):
+{
+  "rating": "GOOD",
+  "feedback": "The response is clear but could use more supporting evidence.",
+  "needs_improvement": true,
+  "focus_areas": ["Add more examples", "Include data points"]
+}
+
+IMPORTANT: Your response should be ONLY the JSON object without any code fences, explanations, or other text.
+</fastagent:instruction>
+"""
+
+_REFINEMENT_PROMPT_INTRO = (
+    "\nYou are tasked with improving a response based on expert feedback. This is iteration "
+)
+
+_REFINEMENT_PROMPT_REQUEST = (
+    " of the refinement process.\n\n"
+    "Your goal is to address all feedback points while maintaining accuracy and "
+    "relevance to the original request.\n\n"
+    "<fastagent:data>\n<fastagent:request>\n"
+)
+
+_REFINEMENT_PROMPT_RESPONSE = "\n</fastagent:request>\n\n<fastagent:previous-response>\n"
+
+_REFINEMENT_PROMPT_OUTRO = """</focus-areas>
+</fastagent:feedback>
+</fastagent:data>
+
+<fastagent:instruction>
+Create an improved version of the response that:
+1. Directly addresses each point in the feedback
+2. Focuses on the specific areas mentioned for improvement
+3. Maintains all the strengths of the original response
+4. Remains accurate and relevant to the original request
+
+Provide your complete improved response without explanations or commentary.
+</fastagent:instruction>
+"""
+
+
 class QualityRating(str, Enum):
     """Enum for evaluation quality ratings."""
 
@@ -77,6 +158,7 @@ class EvaluatorOptimizerAgent(BaseAgent):
         evaluator_agent: Agent,
         min_rating: QualityRating = QualityRating.GOOD,
         max_refinements: int = 3,
+        track_history: bool = False,
         context: Optional[Any] = None,
         **kwargs,
     ) -> None:
@@ -89,6 +171,7 @@ class EvaluatorOptimizerAgent(BaseAgent):
             evaluator_agent: Agent that evaluates responses and provides feedback
             min_rating: Minimum acceptable quality rating to stop refinement
             max_refinements: Maximum number of refinement cycles to attempt
+            track_history: Record each attempt's response and evaluation in refinement_history
             context: Optional context object
             **kwargs: Additional keyword arguments to pass to BaseAgent
         """
@@ -104,6 +187,7 @@ class EvaluatorOptimizerAgent(BaseAgent):
         self.evaluator_agent = evaluator_agent
         self.min_rating = min_rating
         self.max_refinements = max_refinements
+        self.track_history = track_history
         self.refinement_history = []
 
     async def generate(
@@ -138,9 +222,12 @@ class EvaluatorOptimizerAgent(BaseAgent):
         while refinement_count < self.max_refinements:
             logger.debug(f"Evaluating response (iteration {refinement_count + 1})")
 
+            # Flatten the response once - it is used by the eval, history and refinement steps
+            response_text = response.all_text()
+
             # Evaluate current response
             eval_prompt = self._build_eval_prompt(
-                request=request, response=response.all_text(), iteration=refinement_count
+                request=request, response=response_text, iteration=refinement_count
             )
 
             # Create evaluation message and get structured evaluation result
@@ -159,14 +246,15 @@ class EvaluatorOptimizerAgent(BaseAgent):
                     focus_areas=["Improve overall quality"],
                 )
 
-            # Track iteration
-            self.refinement_history.append(
-                {
-                    "attempt": refinement_count + 1,
-                    "response": response.all_text(),
-                    "evaluation": evaluation_result.model_dump(),
-                }
-            )
+            # Track iteration - opt in, as each entry pins the full response text
+            if self.track_history:
+                self.refinement_history.append(
+                    {
+                        "attempt": refinement_count + 1,
+                        "response": response_text,
+                        "evaluation": evaluation_result.model_dump(),
+                    }
+                )
 
             logger.debug(f"Evaluation result: {evaluation_result.rating}")
 
@@ -190,7 +278,7 @@ class EvaluatorOptimizerAgent(BaseAgent):
             # Generate refined response
             refinement_prompt = self._build_refinement_prompt(
                 request=request,
-                response=response.all_text(),
+                response=response_text,
                 feedback=evaluation_result,
                 iteration=refinement_count,
             )
@@ -267,52 +355,17 @@ class EvaluatorOptimizerAgent(BaseAgent):
         Returns:
             Formatted evaluation prompt
         """
-        return f"""
-You are an expert evaluator for content quality. Your task is to evaluate a response against the user's original request.
-
-Evaluate the response for iteration {iteration + 1} and provide structured feedback on its quality and areas for improvement.
-
-<fastagent:data>
-<fastagent:request>
-{request}
-</fastagent:request>
-
-<fastagent:response>
-{response}
-</fastagent:response>
-</fastagent:data>
-
-<fastagent:instruction>
-Your response MUST be valid JSON matching this exact format (no other text, markdown, or explanation):
-
-{{
-  "rating": "RATING",
-  "feedback": "DETAILED FEEDBACK",
-  "needs_improvement": BOOLEAN,
-  "focus_areas": ["FOCUS_AREA_1", "FOCUS_AREA_2", "FOCUS_AREA_3"]
-}}
-
-Where:
-- RATING: Must be one of: "EXCELLENT", "GOOD", "FAIR", or "POOR"
-  - EXCELLENT: No improvements needed
-  - GOOD: Only minor improvements possible
-  - FAIR: Several improvements needed
-  - POOR: Major improvements needed
-- DETAILED FEEDBACK: Specific, actionable feedback (as a single string)
-- BOOLEAN: true or false (lowercase, no quotes) indicating if further improvement is needed
-- FOCUS_AREAS: Array of 1-3 specific areas to focus on (empty array if no improvement needed)
-
-Example of valid response (DO NOT include the triple backticks in your response):
-{{
-  "rating": "GOOD",
-  "feedback": "The response is clear but could use more supporting evidence.",
-  "needs_improvement": true,
-  "focus_areas": ["Add more examples", "Include data points"]
-}}
-
-IMPORTANT: Your response should be ONLY the JSON object without any code fences, explanations, or other text.
-</fastagent:instruction>
-"""
+        return "".join(
+            (
+                _EVAL_PROMPT_INTRO,
+                str(iteration + 1),
+                _EVAL_PROMPT_REQUEST,
+                request,
+                _EVAL_PROMPT_RESPONSE,
+                response,
+                _EVAL_PROMPT_OUTRO,
+            )
+        )
 
     def _build_refinement_prompt(
         self,
@@ -335,34 +388,20 @@ IMPORTANT: Your response should be ONLY the JSON object without any code fences,
         """
         focus_areas = ", ".join(feedback.focus_areas) if feedback.focus_areas else "None specified"
 
-        return f"""
-You are tasked with improving a response based on expert feedback. This is iteration {iteration + 1} of the refinement process.
-
-Your goal is to address all feedback points while maintaining accuracy and relevance to the original request.
-
-<fastagent:data>
-<fastagent:request>
-{request}
-</fastagent:request>
-
-<fastagent:previous-response>
-{response}
-</fastagent:previous-response>
-
-<fastagent:feedback>
-<rating>{feedback.rating}</rating>
-<details>{feedback.feedback}</details>
-<focus-areas>{focus_areas}</focus-areas>
-</fastagent:feedback>
-</fastagent:data>
-
-<fastagent:instruction>
-Create an improved version of the response that:
-1. Directly addresses each point in the feedback
-2. Focuses on the specific areas mentioned for improvement
-3. Maintains all the strengths of the original response
-4. Remains accurate and relevant to the original request
-
-Provide your complete improved response without explanations or commentary.
-</fastagent:instruction>
-"""
+        return "".join(
+            (
+                _REFINEMENT_PROMPT_INTRO,
+                str(iteration + 1),
+                _REFINEMENT_PROMPT_REQUEST,
+                request,
+                _REFINEMENT_PROMPT_RESPONSE,
+                response,
+                "\n</fastagent:previous-response>\n\n<fastagent:feedback>\n<rating>",
+                format(feedback.rating),
+                "</rating>\n<details>",
+                feedback.feedback,
+                "</details>\n<focus-areas>",
+                focus_areas,
+                _REFINEMENT_PROMPT_OUTRO,
+            )
+        )
@@ -409,6 +409,7 @@ def evaluator_optimizer(
     instruction: Optional[str] = None,
     min_rating: str = "GOOD",
     max_refinements: int = 3,
+    track_history: bool = False,
 ) -> Callable[[AgentCallable[P, R]], DecoratedEvaluatorOptimizerProtocol[P, R]]:
     """
     Decorator to create and register an evaluator-optimizer agent with type-safe signature.
@@ -420,6 +421,7 @@ def evaluator_optimizer(
         instruction: Base instruction for the evaluator-optimizer
         min_rating: Minimum acceptable quality rating (EXCELLENT, GOOD, FAIR, POOR)
         max_refinements: Maximum number of refinement iterations
+        track_history: Whether to record each refinement attempt in refinement_history
 
     Returns:
         A decorator that registers the evaluator-optimizer with proper type annotations
@@ -442,5 +444,6 @@ def evaluator_optimizer(
             evaluator=evaluator,
             min_rating=min_rating,
             max_refinements=max_refinements,
+            track_history=track_history,
         ),
     )
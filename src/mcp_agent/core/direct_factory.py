@@ -292,6 +292,7 @@ async def create_agents_by_type(
                 min_rating_str = agent_data.get("min_rating", "GOOD")
                 min_rating = QualityRating(min_rating_str)
                 max_refinements = agent_data.get("max_refinements", 3)
+                track_history = agent_data.get("track_history", False)
 
                 # Create the evaluator-optimizer agent
                 evaluator_optimizer = EvaluatorOptimizerAgent(
@@ -301,6 +302,7 @@ async def create_agents_by_type(
                     evaluator_agent=evaluator_agent,
                     min_rating=min_rating,
                     max_refinements=max_refinements,
+                    track_history=track_history,
                 )
 
                 # Initialize the agent
@@ -6,8 +6,14 @@ EmbeddedResource, and other MCP content types with minimal boilerplate.
 """
 
 import base64
-from pathlib import Path
-from typing import Any, List, Literal, Optional, Union
+import mmap
+import os
+import shutil
+import stat
+import threading
+from functools import lru_cache
+from pathlib import Path, PosixPath, WindowsPath
+from typing import Any, BinaryIO, Iterator, List, Literal, Optional, Union
 
 from mcp.types import (
     Annotations,
@@ -27,6 +33,138 @@ from mcp_agent.mcp.mime_utils import (
     is_image_mime_type,
 )
 
+try:
+    # pybase64 provides SIMD accelerated encoders; fall back to the stdlib if unavailable
+    import pybase64
+
+    pybase64.get_version()  # resolve the CPU specific encoder once at import
+
+    _b64encode_bytes = pybase64.b64encode
+
+    def _b64encode(data: bytes) -> str:
+        return pybase64.b64encode_as_string(data)
+
+except ImportError:
+    _b64encode_bytes = base64.b64encode
+
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+
+# Files larger than this are memory mapped rather than read into a bytes object
+MMAP_THRESHOLD = 512 * 1024
+
+# Chunk size for streamed encoding - a multiple of 3 so chunks encode without padding
+STREAM_CHUNK_SIZE = 48 * 1024
+
+
+class _Base64StreamEncoder:
+    """Write-only sink that base64 encodes data as it arrives, carrying partial 3 byte groups."""
+
+    def __init__(self) -> None:
+        self._encoded = bytearray()
+        self._carry = b""
+
+    def write(self, data: bytes) -> int:
+        chunk = self._carry + data if self._carry else data
+        whole = len(chunk) - len(chunk) % 3
+        self._encoded += _b64encode_bytes(memoryview(chunk)[:whole])
+        self._carry = bytes(chunk[whole:])
+        return len(data)
+
+    def result(self) -> str:
+        if self._carry:
+            self._encoded += _b64encode_bytes(self._carry)
+            self._carry = b""
+        return self._encoded.decode("ascii")
+
+
+def _b64_stream_encode(fp: BinaryIO) -> str:
+    """Base64 encode a file object chunk by chunk, keeping the raw working set bounded."""
+    encoder = _Base64StreamEncoder()
+    shutil.copyfileobj(fp, encoder, STREAM_CHUNK_SIZE)
+    return encoder.result()
+
+
+# Per-thread read buffer reused for files below MMAP_THRESHOLD, so batches of
+# attachments don't allocate a fresh bytes object for every file
+_read_buffers = threading.local()
+
+
+def _read_pooled(f: BinaryIO, size: int) -> memoryview:
+    """Read up to size bytes into this thread's reusable buffer, returning the filled prefix."""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _read_buffers.buffer = bytearray(MMAP_THRESHOLD)
+
+    view = memoryview(buffer)
+    filled = 0
+    while filled < size:
+        count = f.readinto(view[filled:size])
+        if not count:
+            break
+        filled += count
+    return view[:filled]
+
+
+def _b64encode_file(path: str) -> str:
+    """Base64 encode a file, memory mapping large files to avoid an intermediate copy."""
+    with open(path, "rb") as f:
+        file_stat = os.fstat(f.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            # Pipes and devices can't be mapped and don't report a useful size
+            return _b64_stream_encode(f)
+
+        if file_stat.st_size == 0:
+            # procfs and similar report no size, so read whatever is there
+            return _b64encode(f.read())
+
+        if file_stat.st_size <= MMAP_THRESHOLD:
+            return _b64encode(_read_pooled(f, file_stat.st_size))
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _b64encode(mm)
+
+
+# Mime types for the most common attachment extensions, checked before mimetypes
+_FAST_EXT_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".svg": "image/svg+xml",
+    ".json": "application/json",
+    ".html": "text/html",
+}
+
+
+# The mime_utils helpers are pure functions of their string input, so repeated
+# paths and mime types within (and across) prompts can be served from a cache
+@lru_cache(maxsize=2048)
+def _guess_mime_cached(path_str: str) -> str:
+    return guess_mime_type(path_str)
+
+
+def _guess_mime(path_str: str) -> str:
+    """Guess the mime type for a path, using the extension table before mimetypes."""
+    mime_type = _FAST_EXT_MIME.get(os.path.splitext(path_str)[1].lower())
+    return mime_type or _guess_mime_cached(path_str)
+
+
+@lru_cache(maxsize=2048)
+def _is_binary_cached(mime_type: str) -> bool:
+    return is_binary_content(mime_type)
+
+
+@lru_cache(maxsize=2048)
+def _is_image_cached(mime_type: str) -> bool:
+    return is_image_mime_type(mime_type)
+
+
 # Type for all MCP content types
 MCPContentType = Union[TextContent, ImageContent, EmbeddedResource, ResourceContents]
 
@@ -80,17 +218,16 @@ def MCPImage(
         raise ValueError("Only one of path or data can be provided")
 
     if path is not None:
-        path = Path(path)
+        path_str = os.fspath(path)
         if not mime_type:
-            mime_type = guess_mime_type(str(path))
-        with open(path, "rb") as f:
-            data = f.read()
+            mime_type = _guess_mime(path_str)
+        b64_data = _b64encode_file(path_str)
+    else:
+        b64_data = _b64encode(data)
 
     if not mime_type:
         mime_type = "image/png"  # Default
 
-    b64_data = base64.b64encode(data).decode("ascii")
-
     return {
         "role": role,
         "content": ImageContent(
@@ -117,30 +254,29 @@ def MCPFile(
     Returns:
         A dictionary with role and content that can be used in a prompt
     """
-    path = Path(path)
-    uri = f"file://{path.absolute()}"
+    path_str = os.fspath(path)
+    uri = f"file://{os.path.abspath(path_str)}"
 
     if not mime_type:
-        mime_type = guess_mime_type(str(path))
+        mime_type = _guess_mime(path_str)
 
     # Determine if this is text or binary content
-    is_binary = is_binary_content(mime_type)
+    is_binary = _is_binary_cached(mime_type)
 
     if is_binary:
         # Read as binary
-        binary_data = path.read_bytes()
-        b64_data = base64.b64encode(binary_data).decode("ascii")
+        b64_data = _b64encode_file(path_str)
 
         resource = BlobResourceContents(uri=AnyUrl(uri), blob=b64_data, mimeType=mime_type)
     else:
         # Read as text
         try:
-            text_data = path.read_text(encoding="utf-8")
+            with open(path_str, encoding="utf-8") as f:
+                text_data = f.read()
             resource = TextResourceContents(uri=AnyUrl(uri), text=text_data, mimeType=mime_type)
         except UnicodeDecodeError:
             # Fallback to binary if text read fails
-            binary_data = path.read_bytes()
-            b64_data = base64.b64encode(binary_data).decode("ascii")
+            b64_data = _b64encode_file(path_str)
             resource = BlobResourceContents(
                 uri=AnyUrl(uri), blob=b64_data, mimeType=mime_type or "application/octet-stream"
             )
@@ -151,6 +287,101 @@ def MCPFile(
     }
 
 
+def _prompt_from_dict(item: dict, role: Literal["user", "assistant"]) -> List[dict]:
+    if "role" in item and "content" in item:
+        # Already a fully formed message
+        return [item]
+    return [MCPText(str(item), role=role)]
+
+
+def _prompt_from_str(item: str, role: Literal["user", "assistant"]) -> List[dict]:
+    # Simple text content
+    return [MCPText(item, role=role)]
+
+
+def _prompt_from_path(item: Path, role: Literal["user", "assistant"]) -> List[dict]:
+    # File path - determine the content type based on mime type
+    mime_type = _guess_mime(str(item))
+
+    if _is_image_cached(mime_type):
+        # Image files (except SVG which is handled as text)
+        return [MCPImage(path=item, mime_type=mime_type, role=role)]
+
+    # All other file types (text documents, PDFs, SVGs, etc.)
+    return [MCPFile(path=item, mime_type=mime_type, role=role)]
+
+
+def _prompt_from_bytes(item: bytes, role: Literal["user", "assistant"]) -> List[dict]:
+    # Raw binary data, assume image
+    return [MCPImage(data=item, role=role)]
+
+
+def _prompt_from_content(
+    item: Union[TextContent, ImageContent, EmbeddedResource], role: Literal["user", "assistant"]
+) -> List[dict]:
+    # Already a content object, wrap in a message
+    return [{"role": role, "content": item}]
+
+
+def _prompt_from_resource_contents(
+    item: ResourceContents, role: Literal["user", "assistant"]
+) -> List[dict]:
+    # It's a ResourceContents, wrap it in an EmbeddedResource
+    return [{"role": role, "content": EmbeddedResource(type="resource", resource=item)}]
+
+
+def _prompt_from_read_resource_result(
+    item: ReadResourceResult, role: Literal["user", "assistant"]
+) -> List[dict]:
+    # It's a ReadResourceResult, convert each resource content
+    return [
+        {"role": role, "content": EmbeddedResource(type="resource", resource=resource_content)}
+        for resource_content in item.contents
+    ]
+
+
+def _prompt_from_other(item: Any, role: Literal["user", "assistant"]) -> List[dict]:
+    """Handle subclasses and duck-typed items that miss the exact type lookup."""
+    if isinstance(item, dict):
+        return _prompt_from_dict(item, role)
+    if isinstance(item, str):
+        return _prompt_from_str(item, role)
+    if isinstance(item, Path):
+        return _prompt_from_path(item, role)
+    if isinstance(item, bytes):
+        return _prompt_from_bytes(item, role)
+    if isinstance(item, (TextContent, ImageContent, EmbeddedResource)):
+        return _prompt_from_content(item, role)
+    if hasattr(item, "type") and item.type == "resource" and hasattr(item, "resource"):
+        # Looks like an EmbeddedResource but may not be the exact class
+        return [
+            {"role": role, "content": EmbeddedResource(type="resource", resource=item.resource)}
+        ]
+    if isinstance(item, ResourceContents):
+        return _prompt_from_resource_contents(item, role)
+    if isinstance(item, ReadResourceResult):
+        return _prompt_from_read_resource_result(item, role)
+
+    # Try to convert to string
+    return [MCPText(str(item), role=role)]
+
+
+# Exact type lookup for MCPPrompt items, avoiding the isinstance chain for common types
+_PROMPT_HANDLERS = {
+    dict: _prompt_from_dict,
+    str: _prompt_from_str,
+    PosixPath: _prompt_from_path,
+    WindowsPath: _prompt_from_path,
+    bytes: _prompt_from_bytes,
+    TextContent: _prompt_from_content,
+    ImageContent: _prompt_from_content,
+    EmbeddedResource: _prompt_from_content,
+    TextResourceContents: _prompt_from_resource_contents,
+    BlobResourceContents: _prompt_from_resource_contents,
+    ReadResourceResult: _prompt_from_read_resource_result,
+}
+
+
 def MCPPrompt(
     *content_items: Union[dict, str, Path, bytes, MCPContentType, 'EmbeddedResource', 'ReadResourceResult'], 
     role: Literal["user", "assistant"] = "user"
@@ -177,56 +408,31 @@ def MCPPrompt(
     Returns:
         List of messages that can be used in a prompt
     """
-    result = []
+    return list(MCPPromptIter(*content_items, role=role))
 
+
+def MCPPromptIter(
+    *content_items: Union[
+        dict, str, Path, bytes, MCPContentType, "EmbeddedResource", "ReadResourceResult"
+    ],
+    role: Literal["user", "assistant"] = "user",
+) -> Iterator[dict]:
+    """
+    Lazily create prompt messages with various content types.
+
+    Accepts the same content items as MCPPrompt, but yields each message as it is
+    built so that files for later items are only read when the caller pulls them.
+
+    Args:
+        *content_items: Content items of various types
+        role: Role for all items (user or assistant)
+
+    Yields:
+        Messages that can be used in a prompt
+    """
     for item in content_items:
-        if isinstance(item, dict) and "role" in item and "content" in item:
-            # Already a fully formed message
-            result.append(item)
-        elif isinstance(item, str):
-            # Simple text content
-            result.append(MCPText(item, role=role))
-        elif isinstance(item, Path):
-            # File path - determine the content type based on mime type
-            path_str = str(item)
-            mime_type = guess_mime_type(path_str)
-
-            if is_image_mime_type(mime_type):
-                # Image files (except SVG which is handled as text)
-                result.append(MCPImage(path=item, role=role))
-            else:
-                # All other file types (text documents, PDFs, SVGs, etc.)
-                result.append(MCPFile(path=item, role=role))
-        elif isinstance(item, bytes):
-            # Raw binary data, assume image
-            result.append(MCPImage(data=item, role=role))
-        elif isinstance(item, TextContent):
-            # Already a TextContent, wrap in a message
-            result.append({"role": role, "content": item})
-        elif isinstance(item, ImageContent):
-            # Already an ImageContent, wrap in a message
-            result.append({"role": role, "content": item})
-        elif isinstance(item, EmbeddedResource):
-            # Already an EmbeddedResource, wrap in a message
-            result.append({"role": role, "content": item})
-        elif hasattr(item, 'type') and item.type == 'resource' and hasattr(item, 'resource'):
-            # Looks like an EmbeddedResource but may not be the exact class
-            result.append({"role": role, "content": EmbeddedResource(type="resource", resource=item.resource)})
-        elif isinstance(item, ResourceContents):
-            # It's a ResourceContents, wrap it in an EmbeddedResource
-            result.append({"role": role, "content": EmbeddedResource(type="resource", resource=item)})
-        elif isinstance(item, ReadResourceResult):
-            # It's a ReadResourceResult, convert each resource content
-            for resource_content in item.contents:
-                result.append({
-                    "role": role, 
-                    "content": EmbeddedResource(type="resource", resource=resource_content)
-                })
-        else:
-            # Try to convert to string
-            result.append(MCPText(str(item), role=role))
-
-    return result
+        handler = _PROMPT_HANDLERS.get(type(item), _prompt_from_other)
+        yield from handler(item, role)
 
 
 def User(*content_items: Union[dict, str, Path, bytes, MCPContentType, 'EmbeddedResource', 'ReadResourceResult']) -> List[dict]:
@@ -250,5 +456,4 @@ def create_message(content: Any, role: Literal["user", "assistant"] = "user") ->
     Returns:
         A dictionary with role and content that can be used in a prompt
     """
-    messages = MCPPrompt(content, role=role)
-    return messages[0] if messages else {}
+    return next(MCPPromptIter(content, role=role), {})
@@ -10,7 +10,7 @@ from mcp.types import PromptMessage
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 # Import our content helper functions
-from .mcp_content import Assistant, MCPContentType, MCPPrompt, User
+from .mcp_content import MCPContentType, MCPPrompt, MCPPromptIter
 
 
 class Prompt:
@@ -62,7 +62,7 @@ class Prompt:
                 return PromptMessageMultipart(role="user", content=item.content)
                 
         # Use the original implementation for other types
-        messages = User(*content_items)
+        messages = MCPPromptIter(*content_items, role="user")
         return PromptMessageMultipart(role="user", content=[msg["content"] for msg in messages])
 
     @classmethod
@@ -95,7 +95,7 @@ class Prompt:
                 return PromptMessageMultipart(role="assistant", content=item.content)
                 
         # Use the original implementation for other types
-        messages = Assistant(*content_items)
+        messages = MCPPromptIter(*content_items, role="assistant")
         return PromptMessageMultipart(
             role="assistant", content=[msg["content"] for msg in messages]
         )
@@ -152,7 +152,11 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
             result: PromptMessageMultipart = await self.generate(prompt, request_params)
             final_generation = get_text(result.content[-1]) or ""
             await self.show_assistant_message(final_generation)
-            json_data = from_json(final_generation, allow_partial=True)
+            try:
+                # Complete JSON doesn't need the slower partial-mode parser
+                json_data = from_json(final_generation)
+            except ValueError:
+                json_data = from_json(final_generation, allow_partial=True)
             validated_model = model.model_validate(json_data)
 
             return cast("ModelT", validated_model), Prompt.assistant(json_data)
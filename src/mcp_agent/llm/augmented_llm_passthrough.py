@@ -1,7 +1,7 @@
-import json  # Import at the module level
 from typing import Any, List, Optional, Union
 
 from mcp.types import PromptMessage
+from pydantic_core import from_json
 
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.llm.augmented_llm import (
@@ -16,6 +16,9 @@ from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 CALL_TOOL_INDICATOR = "***CALL_TOOL"
 FIXED_RESPONSE_INDICATOR = "***FIXED_RESPONSE"
 
+# Sentinel for single-lookup attribute probes
+_MISSING = object()
+
 
 class PassthroughLLM(AugmentedLLM):
     """
@@ -49,10 +52,7 @@ class PassthroughLLM(AugmentedLLM):
 
         # Handle PromptMessage by concatenating all parts
         if isinstance(message, PromptMessage):
-            parts_text = []
-            for part in message.content:
-                parts_text.append(str(part))
-            return "\n".join(parts_text)
+            return "\n".join(str(part) for part in message.content)
 
         return str(message)
 
@@ -90,18 +90,19 @@ class PassthroughLLM(AugmentedLLM):
         Raises:
             ValueError: If command format is invalid
         """
-        parts = command.split(" ", 2)
-        if len(parts) < 2:
+        _, sep, rest = command.partition(" ")
+        if not sep:
             raise ValueError("Invalid format. Expected '***CALL_TOOL <tool_name> [arguments_json]'")
 
-        tool_name = parts[1].strip()
+        tool_name, _, arg_str = rest.partition(" ")
+        tool_name = tool_name.strip()
         arguments = None
 
-        if len(parts) > 2:
+        if arg_str:
             try:
-                arguments = json.loads(parts[2])
-            except json.JSONDecodeError:
-                raise ValueError(f"Invalid JSON arguments: {parts[2]}")
+                arguments = from_json(arg_str)
+            except ValueError:
+                raise ValueError(f"Invalid JSON arguments: {arg_str}")
 
         self.logger.info(f"Calling tool {tool_name} with arguments {arguments}")
         return tool_name, arguments
@@ -120,19 +121,15 @@ class PassthroughLLM(AugmentedLLM):
         if result.isError:
             error_text = []
             for content_item in result.content:
-                if hasattr(content_item, "text"):
-                    error_text.append(content_item.text)
-                else:
-                    error_text.append(str(content_item))
+                text = getattr(content_item, "text", _MISSING)
+                error_text.append(str(content_item) if text is _MISSING else text)
             error_message = "\n".join(error_text) if error_text else "Unknown error"
             return f"Error calling tool '{tool_name}': {error_message}"
 
         result_text = []
         for content_item in result.content:
-            if hasattr(content_item, "text"):
-                result_text.append(content_item.text)
-            else:
-                result_text.append(str(content_item))
+            text = getattr(content_item, "text", _MISSING)
+            result_text.append(str(content_item) if text is _MISSING else text)
 
         return "\n".join(result_text)
 
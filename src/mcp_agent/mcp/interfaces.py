@@ -161,6 +161,12 @@ class AgentProtocol(AugmentedLLMProtocol, Protocol):
         server_name: str | None = None,
     ) -> GetPromptResult: ...
 
+    async def get_prompts(
+        self,
+        prompts: List[Tuple[str, Dict[str, str] | None]],
+        server_name: str | None = None,
+    ) -> List[GetPromptResult]: ...
+
     async def list_prompts(self, server_name: str | None = None) -> Mapping[str, List[Prompt]]: ...
 
     async def list_resources(self, server_name: str | None = None) -> Mapping[str, List[str]]: ...
@@ -7,6 +7,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     TypeVar,
 )
 
@@ -710,6 +711,27 @@ class MCPAggregator(ContextDependent):
             messages=[],
         )
 
+    async def get_prompts(
+        self,
+        prompts: List[Tuple[str, dict[str, str] | None]],
+        server_name: str | None = None,
+    ) -> List[GetPromptResult]:
+        """
+        Get several prompts at once, issuing the requests concurrently.
+
+        :param prompts: List of (prompt_name, arguments) pairs, as accepted by get_prompt
+        :param server_name: Optional name of the server to get every prompt from
+        :return: GetPromptResults in the same order as the requested prompts
+        """
+        if not self.initialized:
+            await self.load_servers()
+
+        return list(
+            await gather(
+                *(self.get_prompt(name, arguments, server_name) for name, arguments in prompts)
+            )
+        )
+
     async def list_prompts(self, server_name: str | None = None) -> Mapping[str, List[Prompt]]:
         """
         List available prompts from one or all servers.
@@ -11,7 +11,7 @@ import base64
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.prompts.base import (
@@ -33,7 +33,7 @@ from mcp_agent.mcp.prompts.prompt_constants import (
 from mcp_agent.mcp.prompts.prompt_constants import (
     USER_DELIMITER as DEFAULT_USER_DELIMITER,
 )
-from mcp_agent.mcp.prompts.prompt_load import create_messages_with_resources
+from mcp_agent.mcp.prompts.prompt_load import create_messages_with_resources, load_prompt
 from mcp_agent.mcp.prompts.prompt_template import (
     PromptMetadata,
     PromptTemplateLoader,
@@ -93,6 +93,25 @@ prompt_registry: Dict[str, PromptMetadata] = {}
 PromptHandler = Callable[..., Awaitable[List[Message]]]
 
 
+# Messages loaded from JSON prompt files, keyed on prompt name, with the mtime of the
+# file they were loaded from. JSON prompts are self-contained, so an unchanged file means
+# an unchanged prompt. Text templates are rendered on every request, as they can reference
+# resource files that are only read at render time.
+json_prompt_cache: Dict[str, Tuple[int, List[Message]]] = {}
+
+
+def load_json_prompt(name: str, file_path: Path) -> List[Message]:
+    """Load a JSON prompt file as FastMCP messages, reusing the last load if it is unchanged"""
+    mtime = file_path.stat().st_mtime_ns
+    cached = json_prompt_cache.get(name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    messages = convert_to_fastmcp_messages(load_prompt(file_path))
+    json_prompt_cache[name] = (mtime, messages)
+    return messages
+
+
 # Type for resource handler
 ResourceHandler = Callable[[], Awaitable[str | bytes]]
 
@@ -146,8 +165,6 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
             # Simple JSON handling - just load and register directly
             from mcp.server.fastmcp.prompts.base import Prompt, PromptArgument
 
-            from mcp_agent.mcp.prompts.prompt_load import load_prompt
-
             # Create metadata with minimal information
             metadata = PromptMetadata(
                 name=file_path.stem,
@@ -169,12 +186,9 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
 
             prompt_registry[metadata.name] = metadata
 
-            # Create a simple handler that directly loads the JSON file each time
+            # Create a simple handler that loads the JSON file whenever it changes
             async def json_prompt_handler():
-                # Load the messages from the JSON file
-                messages = load_prompt(file_path)
-                # Convert to FastMCP format
-                return convert_to_fastmcp_messages(messages)
+                return load_json_prompt(metadata.name, file_path)
 
             # Register directly with MCP
             prompt = Prompt(
@@ -303,8 +317,8 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
         logger.error(f"Error registering prompt {file_path}: {e}", exc_info=True)
 
 
-def parse_args():
-    """Parse command line arguments"""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments (defaults to sys.argv)"""
     parser = argparse.ArgumentParser(description="FastMCP Prompt Server")
     parser.add_argument("prompt_files", nargs="+", type=str, help="Prompt files to serve")
     parser.add_argument(
@@ -348,7 +362,7 @@ def parse_args():
         "--test", type=str, help="Test a specific prompt without starting the server"
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def initialize_config(args) -> PromptConfig:
@@ -415,6 +429,28 @@ async def register_file_resource_handler(config: PromptConfig) -> None:
             raise
 
 
+async def register_all(config: PromptConfig) -> None:
+    """Register the file resource handler and every configured prompt file"""
+    await register_file_resource_handler(config)
+
+    for file_path in config.prompt_files:
+        register_prompt(file_path, config)
+
+    await prewarm_prompts()
+
+
+async def prewarm_prompts() -> None:
+    """Load every JSON prompt into the cache, so first requests don't parse the file"""
+    for name, metadata in prompt_registry.items():
+        if metadata.file_path.suffix.lower() != ".json":
+            continue
+        try:
+            load_json_prompt(name, metadata.file_path)
+        except Exception as e:
+            # Leave the error to be reported when the prompt is actually requested
+            logger.warning(f"Could not prewarm prompt {name}: {e}")
+
+
 async def test_prompt(prompt_name: str, config: PromptConfig) -> int:
     """Test a prompt and print its details"""
     if prompt_name not in prompt_registry:
@@ -474,12 +510,7 @@ async def async_main() -> int:
         logger.error(str(e))
         return 1
 
-    # Register resource handlers
-    await register_file_resource_handler(config)
-
-    # Register all prompts
-    for file_path in config.prompt_files:
-        register_prompt(file_path, config)
+    await register_all(config)
 
     # Print startup info
     logger.info("Starting prompt server")
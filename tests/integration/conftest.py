@@ -1,11 +1,27 @@
+import asyncio
 import importlib
 import os
+import sys
 from pathlib import Path
 
 import pytest
 
 from mcp_agent.core.fastagent import FastAgent
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+
+# Run the async tests on uvloop where it is available
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Event loop policy used by pytest-asyncio for every loop scope"""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
 
 # Keep the auto-cleanup fixture
 @pytest.fixture(scope="function", autouse=True)
@@ -0,0 +1,105 @@
+import os
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+import pytest_asyncio
+import yaml
+from mcp.shared.memory import create_client_server_memory_streams
+
+from mcp_agent.core.fastagent import FastAgent
+from mcp_agent.logging.transport import AsyncEventBus
+from mcp_agent.mcp import mcp_connection_manager
+from mcp_agent.mcp.prompts import prompt_server
+
+# Set to run the prompts server in-process over memory streams instead of as a subprocess
+IN_PROCESS_ENV = "FAST_AGENT_IN_PROCESS_SERVERS"
+
+
+@asynccontextmanager
+async def in_process_prompt_server():
+    """Serve the (process global) prompt server to one client over memory streams"""
+    server = prompt_server.mcp._mcp_server
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(
+                lambda: server.run(*server_streams, server.create_initialization_options())
+            )
+            try:
+                yield client_streams
+            finally:
+                tg.cancel_scope.cancel()
+
+
+async def use_in_process_prompt_server(config_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route connections to the prompt-server command through the in-process prompt server"""
+    # Prompts register on module globals, so only the first module to ask loads them
+    if not prompt_server.prompt_registry:
+        with open(config_file, encoding="utf-8") as f:
+            server_args = yaml.safe_load(f)["mcp"]["servers"]["prompts"]["args"]
+        config = prompt_server.initialize_config(prompt_server.parse_args(server_args))
+        await prompt_server.register_all(config)
+
+    stdio_client = mcp_connection_manager.stdio_client
+
+    def stdio_or_in_process(server_params, **kwargs):
+        if server_params.command == "prompt-server":
+            return in_process_prompt_server()
+        return stdio_client(server_params, **kwargs)
+
+    monkeypatch.setattr(mcp_connection_manager, "stdio_client", stdio_or_in_process)
+
+
+# Overrides the per-test reset in tests/integration/conftest.py: prompt_agent keeps the
+# event bus in use across the module, so only reset it once that has shut down
+@pytest.fixture(scope="module", autouse=True)
+def cleanup_event_bus():
+    """Reset the AsyncEventBus after the module's tests (and prompt_agent) have finished"""
+    yield
+    AsyncEventBus.reset()
+
+
+# Share the running agents (and prompts server connection) across the module
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def prompt_agent(request):
+    """
+    Starts a FastAgent with "test" and "passthrough" agents attached to the prompts server
+    once per module.
+    The MCP transport is bound to the loop that created it, so tests using this
+    fixture must run in the module scoped event loop as well.
+
+    With FAST_AGENT_IN_PROCESS_SERVERS set, the prompts server runs in this process
+    for the duration of the module rather than as a stdio subprocess.
+    """
+    test_dir = os.path.dirname(request.module.__file__)
+    config_file = os.path.join(test_dir, "fastagent.config.yaml")
+    original_cwd = os.getcwd()
+    os.chdir(test_dir)
+
+    monkeypatch = pytest.MonkeyPatch()
+    if os.environ.get(IN_PROCESS_ENV):
+        await use_in_process_prompt_server(config_file, monkeypatch)
+
+    fast = FastAgent("Test Agent", config_path=config_file, ignore_unknown_args=True)
+
+    @fast.agent(name="test", servers=["prompts"])
+    async def agent_function():
+        pass
+
+    # Separate agent for apply_prompt, which adds to the agent's message history
+    @fast.agent(name="passthrough", servers=["prompts"], model="passthrough")
+    async def passthrough_function():
+        pass
+
+    try:
+        async with fast.run() as agent:
+            yield agent
+    finally:
+        monkeypatch.undo()
+        os.chdir(original_cwd)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def passthrough_agent(prompt_agent):
+    """The module's passthrough model agent, for tests that apply prompts"""
+    return prompt_agent["passthrough"]
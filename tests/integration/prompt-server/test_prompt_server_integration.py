@@ -2,171 +2,92 @@ from typing import TYPE_CHECKING, Dict, List
 
 import pytest
 
-from mcp_agent.mcp.helpers.content_helpers import get_text, is_image_content
+from mcp_agent.mcp.helpers.content_helpers import is_image_content
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 if TYPE_CHECKING:
     from mcp.types import GetPromptResult, Prompt
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_no_delimiters(fast_agent):
-    """Single user message."""
-    # Use the FastAgent instance from the test directory fixture
-    fast = fast_agent
-
-    # Define the agent
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            x: GetPromptResult = await agent["test"].get_prompt("simple", None)
-            y: list[PromptMessageMultipart] = PromptMessageMultipart.to_multipart(x.messages)
-            assert "simple, no delimiters" == y[0].first_text()
-            assert "user" == y[0].role
-            assert len(y) == 1
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_no_delimiters_with_variables(fast_agent):
-    """Single user message, with substitutions."""
-    # Use the FastAgent instance from the test directory fixture
-    fast = fast_agent
-
-    # Define the agent
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            x: GetPromptResult = await agent["test"].get_prompt(
-                "simple_sub", {"product": "fast-agent", "company": "llmindset"}
-            )
-            y: list[PromptMessageMultipart] = PromptMessageMultipart.to_multipart(x.messages)
-            assert "this is fast-agent by llmindset" == y[0].first_text()
-            assert "user" == y[0].role
-            assert len(y) == 1
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_multiturn(fast_agent):
-    """Multipart Message."""
-    # Use the FastAgent instance from the test directory fixture
-    fast = fast_agent
-
-    # Define the agent
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            x: GetPromptResult = await agent["test"].get_prompt("multi", None)
-            y: list[PromptMessageMultipart] = PromptMessageMultipart.to_multipart(x.messages)
-            assert "good morning" == y[0].first_text()
-            assert "user" == y[0].role
-            assert "how may i help you?" == y[1].first_text()
-            assert "assistant" == y[1].role
-            assert len(y) == 2
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_multiturn_with_subsitition(fast_agent):
-    """Multipart Message, with substitutions."""
-    # Use the FastAgent instance from the test directory fixture
-    fast = fast_agent
-
-    # Define the agent
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            x: GetPromptResult = await agent["test"].get_prompt(
-                "multi_sub", {"user_name": "evalstate", "assistant_name": "HAL9000"}
-            )
-            y: list[PromptMessageMultipart] = PromptMessageMultipart.to_multipart(x.messages)
-            assert "hello, my name is evalstate" == y[0].first_text()
-            assert "user" == y[0].role
-            assert "nice to meet you. i am HAL9000" == y[1].first_text()
-            assert "assistant" == y[1].role
-            assert len(y) == 2
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_agent_interface_returns_prompts_list(fast_agent):
+# Every test is an integration test, run on the module event loop that owns the
+# prompt_agent connection
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="module")]
+
+
+# (prompt name, arguments, expected (role, text) for each message)
+PROMPT_CASES = [
+    pytest.param("simple", None, [("user", "simple, no delimiters")], id="no_delimiters"),
+    pytest.param(
+        "simple_sub",
+        {"product": "fast-agent", "company": "llmindset"},
+        [("user", "this is fast-agent by llmindset")],
+        id="no_delimiters_with_variables",
+    ),
+    pytest.param(
+        "multi",
+        None,
+        [("user", "good morning"), ("assistant", "how may i help you?")],
+        id="multiturn",
+    ),
+    pytest.param(
+        "multi_sub",
+        {"user_name": "evalstate", "assistant_name": "HAL9000"},
+        [("user", "hello, my name is evalstate"), ("assistant", "nice to meet you. i am HAL9000")],
+        id="multiturn_with_substitution",
+    ),
+]
+
+
+@pytest.mark.parametrize("name,arguments,expected", PROMPT_CASES)
+@pytest.mark.parametrize("server_name", [None, "prompts"], ids=["any_server", "server_param"])
+async def test_get_prompt(prompt_agent, name, arguments, expected, server_name):
+    """Prompt templates, with and without delimiters and substitutions and server name."""
+    x: GetPromptResult = await prompt_agent["test"].get_prompt(name, arguments, server_name)
+    y: list[PromptMessageMultipart] = PromptMessageMultipart.to_multipart(x.messages)
+    assert expected == [(message.role, message.first_text()) for message in y]
+
+
+async def test_all_prompts_concurrent(prompt_agent):
+    """Fetch every prompt case with a single concurrent get_prompts call."""
+    results: list[GetPromptResult] = await prompt_agent["test"].get_prompts(
+        [(case.values[0], case.values[1]) for case in PROMPT_CASES]
+    )
+    for result, case in zip(results, PROMPT_CASES):
+        y = PromptMessageMultipart.to_multipart(result.messages)
+        assert case.values[2] == [(message.role, message.first_text()) for message in y]
+
+
+async def test_agent_interface_returns_prompts_list(prompt_agent):
     """Test list_prompts functionality."""
-    # Use the FastAgent instance from the test directory fixture
-    fast = fast_agent
-
-    # Define the agent
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            prompts: Dict[str, List[Prompt]] = await agent.test.list_prompts()
-            assert 5 == len(prompts["prompts"])
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_prompt_with_server_param(fast_agent):
-    """Test get_prompt with explicit server parameter."""
-    fast = fast_agent
-
-    @fast.agent(name="test", servers=["prompts"])
-    async def agent_function():
-        async with fast.run() as agent:
-            # Test with explicit server parameter
-            prompt: GetPromptResult = await agent.test.get_prompt("simple", server_name="prompts")
-            assert "simple, no delimiters" == get_text(prompt.messages[0].content)
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_apply_prompt_with_server_param(fast_agent):
-    """Test apply_prompt with server parameter."""
-    fast = fast_agent
-
-    @fast.agent(name="test", servers=["prompts"], model="passthrough")
-    async def agent_function():
-        async with fast.run() as agent:
-            # Test apply_prompt with explicit server parameter
-            response = await agent.test.apply_prompt("simple", server_name="prompts")
-            assert response is not None
-
-            # Test with both arguments and server parameter
-            response = await agent.test.apply_prompt(
-                "simple_sub",
-                arguments={"product": "test-product", "company": "test-company"},
-                server_name="prompts",
-            )
-            assert response is not None
-            assert "test-product" in response or "test-company" in response
-
-    await agent_function()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_handling_multipart_json_format(fast_agent):
+    prompts: Dict[str, List[Prompt]] = await prompt_agent.test.list_prompts()
+    assert 5 == len(prompts["prompts"])
+
+
+@pytest.mark.parametrize(
+    "prompt,arguments,expected",
+    [
+        pytest.param("simple", None, [], id="simple"),
+        pytest.param(
+            "simple_sub",
+            {"product": "test-product", "company": "test-company"},
+            ["test-product", "test-company"],
+            id="simple_sub",
+        ),
+    ],
+)
+async def test_apply_prompt_with_server_param(passthrough_agent, prompt, arguments, expected):
+    """Test apply_prompt with server parameter, with and without arguments."""
+    response = await passthrough_agent.apply_prompt(
+        prompt, arguments=arguments, server_name="prompts"
+    )
+    assert response is not None
+    if expected:
+        assert any(text in response for text in expected)
+
+
+async def test_handling_multipart_json_format(prompt_agent):
     """Make sure that multipart mixed content from JSON is handled"""
-    fast = fast_agent
+    x: GetPromptResult = await prompt_agent["test"].get_prompt("multipart")
 
-    @fast.agent(name="test", servers=["prompts"], model="passthrough")
-    async def agent_function():
-        async with fast.run() as agent:
-            x: GetPromptResult = await agent["test"].get_prompt("multipart")
-
-            assert 5 == len(x.messages)
-            assert is_image_content(x.messages[3].content)
-
-    await agent_function()
+    assert 5 == len(x.messages)
+    assert is_image_content(x.messages[3].content)
@@ -37,7 +37,11 @@ async def test_single_refinement_cycle(fast_agent):
     @fast.agent(name="generator", model="passthrough")
     @fast.agent(name="evaluator", model="passthrough")
     @fast.evaluator_optimizer(
-        name="optimizer", generator="generator", evaluator="evaluator", max_refinements=1
+        name="optimizer",
+        generator="generator",
+        evaluator="evaluator",
+        max_refinements=1,
+        track_history=True,
     )
     async def agent_function():
         async with fast.run() as agent:
@@ -102,6 +106,7 @@ async def test_max_refinements_limit(fast_agent):
         generator="generator_max",
         evaluator="evaluator_max",
         max_refinements=2,  # Set limit to 2 refinements
+        track_history=True,
     )
     async def agent_function():
         async with fast.run() as agent:
@@ -180,6 +185,7 @@ async def test_early_stop_on_quality(fast_agent):
         evaluator="evaluator_quality",
         min_rating=QualityRating.GOOD,  # Stop when reaching GOOD quality
         max_refinements=5,
+        track_history=True,
     )
     async def agent_function():
         async with fast.run() as agent:
@@ -0,0 +1,52 @@
+"""
+Unit tests for the evaluator-optimizer agent's prompt construction.
+"""
+
+from mcp_agent.agents.agent import Agent
+from mcp_agent.agents.workflow.evaluator_optimizer import (
+    EvaluationResult,
+    EvaluatorOptimizerAgent,
+    QualityRating,
+)
+from mcp_agent.core.agent_types import AgentConfig
+
+
+def test_refinement_prompt_rendering():
+    """The refinement prompt matches its template, with the rating formatted as in an f-string"""
+    eval_optimizer = EvaluatorOptimizerAgent(
+        config=AgentConfig(name="test_eval_optimizer"),
+        generator_agent=Agent(config=AgentConfig(name="generator")),
+        evaluator_agent=Agent(config=AgentConfig(name="evaluator")),
+    )
+    feedback = EvaluationResult(
+        rating=QualityRating.FAIR,
+        feedback="Too terse",
+        needs_improvement=True,
+        focus_areas=["detail", "tone"],
+    )
+
+    prompt = eval_optimizer._build_refinement_prompt("Write a haiku", "Leaves fall", feedback, 1)
+
+    assert prompt == (
+        "\nYou are tasked with improving a response based on expert feedback. "
+        "This is iteration 2 of the refinement process.\n\n"
+        "Your goal is to address all feedback points while maintaining accuracy and "
+        "relevance to the original request.\n\n"
+        "<fastagent:data>\n"
+        "<fastagent:request>\nWrite a haiku\n</fastagent:request>\n\n"
+        "<fastagent:previous-response>\nLeaves fall\n</fastagent:previous-response>\n\n"
+        "<fastagent:feedback>\n"
+        f"<rating>{QualityRating.FAIR}</rating>\n"
+        "<details>Too terse</details>\n"
+        "<focus-areas>detail, tone</focus-areas>\n"
+        "</fastagent:feedback>\n"
+        "</fastagent:data>\n\n"
+        "<fastagent:instruction>\n"
+        "Create an improved version of the response that:\n"
+        "1. Directly addresses each point in the feedback\n"
+        "2. Focuses on the specific areas mentioned for improvement\n"
+        "3. Maintains all the strengths of the original response\n"
+        "4. Remains accurate and relevant to the original request\n\n"
+        "Provide your complete improved response without explanations or commentary.\n"
+        "</fastagent:instruction>\n"
+    )
@@ -3,20 +3,29 @@ Tests for the mcp_content module.
 """
 
 import base64
+import importlib
+import io
 import os
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 from mcp.types import EmbeddedResource, ImageContent, TextContent
 
+from mcp_agent.core import mcp_content
 from mcp_agent.core.mcp_content import (
+    MMAP_THRESHOLD,
+    STREAM_CHUNK_SIZE,
     Assistant,
     MCPFile,
     MCPImage,
     MCPPrompt,
+    MCPPromptIter,
     MCPText,
     User,
+    _b64_stream_encode,
+    _Base64StreamEncoder,
 )
 
 
@@ -229,3 +238,109 @@ def test_user_assistant_functions():
     assert messages[1]["role"] == "assistant"
     assert messages[0]["content"].text == "I'm fine, thanks!"
     assert messages[1]["content"].text == "How can I help?"
+
+
+def test_large_binary_resource_content():
+    """Test that large binary files (memory mapped) round trip correctly."""
+    payload = os.urandom(MMAP_THRESHOLD + 1234)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(payload)
+        binary_path = f.name
+
+    try:
+        message = MCPFile(binary_path)
+
+        assert message["content"].resource.mimeType == "application/pdf"
+        assert base64.b64decode(message["content"].resource.blob) == payload
+
+    finally:
+        os.unlink(binary_path)
+
+
+def test_stream_encode_matches_one_shot():
+    """Test that chunked base64 encoding matches the stdlib encoder."""
+    payload = os.urandom(3 * STREAM_CHUNK_SIZE + 7)
+
+    assert _b64_stream_encode(io.BytesIO(payload)) == base64.b64encode(payload).decode("ascii")
+    assert _b64_stream_encode(io.BytesIO(b"")) == ""
+
+    # Writes that don't align to 3 byte groups are carried over
+    encoder = _Base64StreamEncoder()
+    for start in range(0, len(payload), 1000):
+        encoder.write(payload[start : start + 1000])
+    assert encoder.result() == base64.b64encode(payload).decode("ascii")
+
+
+def test_pybase64_encoders():
+    """Test that the pybase64 encoders are used when installed, and match the stdlib."""
+    pybase64 = pytest.importorskip("pybase64")
+    payload = os.urandom(3 * STREAM_CHUNK_SIZE + 7)
+
+    assert mcp_content._b64encode_bytes is pybase64.b64encode
+    assert mcp_content._b64encode(payload) == base64.b64encode(payload).decode("ascii")
+    assert _b64_stream_encode(io.BytesIO(payload)) == base64.b64encode(payload).decode("ascii")
+
+
+def test_stdlib_base64_fallback(monkeypatch):
+    """Test that encoding falls back to the stdlib when pybase64 can't be imported."""
+    payload = os.urandom(STREAM_CHUNK_SIZE + 7)
+    expected = base64.b64encode(payload).decode("ascii")
+    monkeypatch.setitem(sys.modules, "pybase64", None)
+    try:
+        fallback = importlib.reload(mcp_content)
+
+        assert fallback._b64encode_bytes is base64.b64encode
+        assert fallback._b64encode(payload) == expected
+        assert fallback._b64_stream_encode(io.BytesIO(payload)) == expected
+    finally:
+        monkeypatch.undo()
+        importlib.reload(mcp_content)
+
+
+def test_prompt_subclass_items():
+    """Test that subclasses of supported types are handled like their base types."""
+
+    class Name(str):
+        pass
+
+    messages = MCPPrompt(Name("Hello"), {"not": "a message"}, 42)
+
+    assert len(messages) == 3
+    assert messages[0]["content"].text == "Hello"
+    assert messages[1]["content"].text == "{'not': 'a message'}"
+    assert messages[2]["content"].text == "42"
+
+
+def test_repeated_images_reuse_read_buffer():
+    """Test that a smaller file read after a larger one doesn't pick up stale bytes."""
+    paths = []
+    for payload in (b"a" * 4096, b"b" * 10):
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            f.write(payload)
+            paths.append((f.name, payload))
+
+    try:
+        for path, payload in paths:
+            message = MCPImage(path)
+            assert base64.b64decode(message["content"].data) == payload
+
+    finally:
+        for path, _ in paths:
+            os.unlink(path)
+
+
+def test_prompt_iter_is_lazy():
+    """Test that MCPPromptIter only reads files as messages are pulled."""
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+        f.write(b"Hello, world!")
+        temp_path = f.name
+
+    messages = MCPPromptIter("first", Path(temp_path))
+    try:
+        assert next(messages)["content"].text == "first"
+    finally:
+        # The file is removed before the second message is requested
+        os.unlink(temp_path)
+
+    with pytest.raises(FileNotFoundError):
+        next(messages)
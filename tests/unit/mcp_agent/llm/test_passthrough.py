@@ -85,4 +85,14 @@ async def test_parse_tool_call_with_args():
     assert "value" == args["arg"]
 
 
+@pytest.mark.asyncio
+async def test_parse_tool_call_invalid_args():
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    with pytest.raises(ValueError, match="Invalid JSON arguments"):
+        llm._parse_tool_command(f"{CALL_TOOL_INDICATOR} mcp_tool_name {{not json")
+
+    with pytest.raises(ValueError, match="Invalid format"):
+        llm._parse_tool_command(CALL_TOOL_INDICATOR)
+
+
 # actual tool calling is covered in the integration tests
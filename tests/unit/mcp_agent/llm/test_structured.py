@@ -77,6 +77,25 @@ async def test_structured_with_bad_json():
     assert None is result
 
 
+@pytest.mark.asyncio
+async def test_structured_with_truncated_json():
+    # Truncated output fails the complete parse and falls back to partial parsing
+    complete = (
+        '{"categories": [{"category": "tech_support", "confidence": "high", "reasoning": null}]}'
+    )
+    truncated = complete[:-1]
+
+    llm = PassthroughLLM(name="structured")
+    result, message = await llm.structured([Prompt.user(truncated)], model=StructuredResponse)
+
+    assert isinstance(result, StructuredResponse)
+    assert result.categories[0].category == "tech_support"
+
+    # The assistant message is rendered the same way whichever parser succeeded
+    _, complete_message = await llm.structured([Prompt.user(complete)], model=StructuredResponse)
+    assert complete_message.first_text() == message.first_text()
+
+
 @pytest.mark.asyncio
 async def test_chat_turn_counting():
     # Create PassthroughLLM instance and use it to process the JSON
@@ -0,0 +1,90 @@
+"""
+Tests for the prompt server's JSON prompt cache and startup prewarming.
+"""
+
+import json
+import os
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from mcp_agent.mcp.prompts import prompt_server
+
+
+@pytest.fixture(autouse=True)
+def fresh_server(monkeypatch):
+    """Give each test its own FastMCP server, registries and cache"""
+    monkeypatch.setattr(prompt_server, "mcp", FastMCP("Prompt Server"))
+    monkeypatch.setattr(prompt_server, "prompt_registry", {})
+    monkeypatch.setattr(prompt_server, "exposed_resources", {})
+    monkeypatch.setattr(prompt_server, "json_prompt_cache", {})
+
+
+async def register(*paths) -> None:
+    args = prompt_server.parse_args([str(path) for path in paths])
+    await prompt_server.register_all(prompt_server.initialize_config(args))
+
+
+def write_json_prompt(path, text: str) -> None:
+    path.write_text(
+        json.dumps({"messages": [{"role": "user", "content": {"type": "text", "text": text}}]})
+    )
+
+
+def touch_later(path) -> None:
+    """Move the file's mtime forward, so a rewrite within the clock granularity is seen"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+async def test_json_prompt_reused_until_file_changes(tmp_path):
+    prompt_file = tmp_path / "history.json"
+    write_json_prompt(prompt_file, "before")
+    await register(prompt_file)
+
+    first = await prompt_server.mcp.get_prompt("history")
+    cached = prompt_server.json_prompt_cache["history"][1]
+    await prompt_server.mcp.get_prompt("history")
+    assert cached is prompt_server.json_prompt_cache["history"][1]
+    assert "before" == first.messages[0].content.text
+
+    write_json_prompt(prompt_file, "after")
+    touch_later(prompt_file)
+
+    second = await prompt_server.mcp.get_prompt("history")
+    assert "after" == second.messages[0].content.text
+
+
+async def test_template_resources_read_on_every_request(tmp_path):
+    prompt_file = tmp_path / "with_notes.txt"
+    prompt_file.write_text("---USER\nread these notes\n---RESOURCE\nnotes.txt\n")
+    notes = tmp_path / "notes.txt"
+    await register(prompt_file)
+
+    # The resource is missing, so it is left out of the prompt
+    result = await prompt_server.mcp.get_prompt("with_notes")
+    assert 1 == len(result.messages)
+
+    notes.write_text("first notes")
+    result = await prompt_server.mcp.get_prompt("with_notes")
+    assert 2 == len(result.messages)
+    assert "first notes" == result.messages[1].content.resource.text
+
+    notes.write_text("second notes")
+    result = await prompt_server.mcp.get_prompt("with_notes")
+    assert "second notes" == result.messages[1].content.resource.text
+
+
+async def test_prewarm_loads_json_prompts(tmp_path):
+    history = tmp_path / "history.json"
+    write_json_prompt(history, "hello")
+    with_notes = tmp_path / "with_notes.txt"
+    with_notes.write_text("---USER\nread these notes\n---RESOURCE\nnotes.txt\n")
+
+    await register(history, with_notes)
+    assert ["history"] == list(prompt_server.json_prompt_cache)
+
+    # A resource missing at startup is not baked into the template's prompt
+    (tmp_path / "notes.txt").write_text("notes")
+    result = await prompt_server.mcp.get_prompt("with_notes")
+    assert 2 == len(result.messages)